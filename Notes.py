@@ -1,13 +1,91 @@
 #!/usr/bin/python
 import os
 import click
+import ctypes
+import errno
+import functools
+import gzip
+import hashlib
+import itertools
+import json
+import queue
+import shutil
+import stat
+import struct
 import subprocess
+import sys
+import sysconfig
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+# The rich console is created on first use, importing rich slows down startup
+console = None
+
+# File listings are reused for CACHE_TTL seconds while the directory is unchanged,
+# each listing is stored in its own file under CACHE_DIR
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "notesmanager",
+)
+CACHE_TTL = 60
+
+# File types listed by open-file (add more as needed)
+ALLOWED_FILE_TYPES = frozenset({".pdf", ".epub", ".md"})
+PDF_FILE_TYPES = frozenset({".pdf"})
+
+# Viewer command for each file type and whether it runs detached from the terminal
+VIEWERS = {
+    # Markdown (.md) files open in nvim or your preferred text editor
+    ".md": (["nvim"], False),
+    # PDF files open in zathura or your preferred PDF reader
+    ".pdf": (["zathura"], True),
+    # EPUB files open in ebook-viewer or your preferred EPUB reader
+    ".epub": (["ebook-viewer"], True),
+}
+
+# Folders that never contain notes, skipped in addition to hidden folders
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", ".git", ".venv"})
+
+# Project templates (you can add more as needed): dicts are folders, None is a file
+PROJECT_TEMPLATES = {
+    "default": {
+        "notes": {
+            "notes.md": None,
+            "reference": {},
+        },
+    },
+    "webapp": {
+        "src": {
+            "app.py": None,
+            "static": {},
+            "templates": {},
+        },
+        "data": {},
+        "docs": {},
+        "README.md": None,
+    },
+}
+
+
+def compile_template(tree, parent=""):
+    """Flatten a template into ("d" | "f", relative path) tuples, parents first."""
+    entries = []
+    for name, children in tree.items():
+        path = os.path.join(parent, name)
+        if children is None:
+            entries.append(("f", path))
+        else:
+            entries.append(("d", path))
+            entries.extend(compile_template(children, path))
+    return entries
 
-# Importing rich for rich text rendering
-from rich.console import Console
 
-# Create a console object to print colored and formatted text
-console = Console()
+# Templates are resolved once at import so create_project only replays them
+COMPILED_TEMPLATES = {
+    name: tuple(compile_template(tree)) for name, tree in PROJECT_TEMPLATES.items()
+}
 
 
 @click.group()
@@ -24,83 +102,304 @@ def notes():
 )
 @click.option("--pdf-only", is_flag=True, help="Search for PDF files only")
 @click.option("--uni", is_flag=True, help="Search in ~/GoogleDrive/Universitá only")
-def open_file(directory, pdf_only, uni):
+@click.option(
+    "--stat-threads",
+    default=16,
+    type=click.IntRange(min=1),
+    help="Number of threads used to scan directories in parallel",
+)
+@click.option("--refresh", is_flag=True, help="Ignore the cached file list")
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="Folder name to skip while searching (can be repeated)",
+)
+def open_file(directory, pdf_only, uni, stat_threads, refresh, exclude):
     """Open a note file, PDF, or EPUB using the appropriate viewer."""
     # Expand the tilde '~' symbol to the user's home directory
     directory = os.path.expanduser(directory)
 
-    if pdf_only:
-        allowed_file_types = {".pdf"}
-    else:
-        allowed_file_types = {".pdf", ".epub", ".md"}  # Add more file types as needed
+    allowed_file_types = PDF_FILE_TYPES if pdf_only else ALLOWED_FILE_TYPES
 
     if uni:
         directory = os.path.join(directory, "Università")
 
-    files = get_file_list(directory, allowed_file_types)
-    if not files:
-        console.print("[red]Error:[/red] No files found.")
+    # Set once fzf exits so the walk stops instead of running to completion
+    stop = threading.Event()
+    files = get_cached_file_list(
+        directory,
+        allowed_file_types,
+        stat_threads,
+        refresh,
+        SKIP_DIRS.union(exclude),
+        stop,
+    )
+    first_file = next(files, None)
+    if first_file is None:
+        print_error("No files found.")
         return
 
-    selected_file = fzf_select(files)
+    selected_file = fzf_select(itertools.chain((first_file,), files), stop)
     if not selected_file:
-        console.print("[red]Error:[/red] No file selected.")
+        print_error("No file selected.")
         return
 
-    file_extension = os.path.splitext(selected_file)[1]
-    if file_extension == ".md":
-        # Open Markdown (.md) files using nvim or your preferred text editor
-        subprocess.run(["nvim", selected_file])
-    elif file_extension == ".pdf":
-        # Open PDF files using zathura or your preferred PDF reader detached from the terminal
-        subprocess.Popen(["zathura", selected_file], preexec_fn=os.setpgrp)
-    elif file_extension == ".epub":
-        # Open EPUB files using ebook-viewer or your preferred EPUB reader
-        subprocess.run(["ebook-viewer", selected_file])
+    open_file_with_appropriate_viewer(selected_file)
+
+
+def get_file_list(
+    directory, allowed_file_types, threads=16, skip_dirs=SKIP_DIRS, stop=None
+):
+    """Yield the files in the specified directory based on allowed file types.
+
+    Directories are scanned by a pool of threads so that the readdir round-trips
+    on network mounts overlap; files are yielded as each directory completes.
+    Setting the optional stop event ends the walk early; the event is only read,
+    so after the generator is exhausted it tells whether the walk was complete.
+    """
+    found = queue.Queue()
+    closed = threading.Event()  # Set once the caller stops reading
+    lock = threading.Lock()
+    pending = 0  # Directories submitted but not scanned yet
+
+    def stopped():
+        return closed.is_set() or (stop is not None and stop.is_set())
+
+    def submit(path):
+        nonlocal pending
+        with lock:
+            pending += 1
+        try:
+            executor.submit(scan, path)
+        except RuntimeError:
+            # The executor was shut down because the caller stopped reading
+            pass
+
+    def scan(path):
+        nonlocal pending
+        files = []
+        try:
+            if stopped():
+                # Don't read queued folders once nobody wants the result, the
+                # finally below still accounts for this one
+                return
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune hidden and skipped folders before descending
+                        name = entry.name
+                        if name[0] != "." and name not in skip_dirs and not stopped():
+                            submit(entry.path)
+                        continue
+                    # A matching suffix is enough to treat the entry as a file,
+                    # dotfiles such as '.md' have no suffix
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot > 0 and name[dot:].lower() in allowed_file_types:
+                        files.append(entry.path)
+        except OSError:
+            # Skip unreadable directories like os.walk does
+            pass
+        finally:
+            found.put(files)
+            with lock:
+                pending -= 1
+                if not pending:
+                    found.put(None)
+
+    executor = ThreadPoolExecutor(max_workers=threads)
+    try:
+        submit(directory)
+        while (files := found.get()) is not None and not stopped():
+            yield from files
+    finally:
+        closed.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_console():
+    """Get the rich console used to print colored and formatted text."""
+    global console
+    if console is None:
+        from rich.console import Console
+
+        console = Console()
+    return console
+
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name):
+    """Resolve a program on $PATH once per process, falling back to the bare name."""
+    return shutil.which(name) or name
+
+
+def print_error(message):
+    """Print an error message to stderr without going through rich."""
+    if sys.stderr.isatty():
+        sys.stderr.write(f"\x1b[31mError:\x1b[0m {message}\n")
     else:
-        console.print("[red]Error:[/red] Unsupported file type.")
+        sys.stderr.write(f"Error: {message}\n")
+
+
+def get_cached_file_list(
+    directory,
+    allowed_file_types,
+    threads=16,
+    refresh=False,
+    skip_dirs=SKIP_DIRS,
+    stop=None,
+):
+    """Yield the files from get_file_list, reusing a recent listing if available."""
+    key = "|".join([directory, *sorted(allowed_file_types), "!", *sorted(skip_dirs)])
+    started = time.time()
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        mtime = None
 
+    if not refresh and mtime is not None:
+        cached_files = load_file_list_cache(key, mtime)
+        if cached_files is not None:
+            yield from cached_files
+            return
 
-def get_file_list(directory, allowed_file_types):
-    """Get a list of files in the specified directory based on allowed file types."""
     files = []
-    for root, _, filenames in os.walk(directory):
-        for filename in filenames:
-            _, ext = os.path.splitext(filename)
-            if ext.lower() in allowed_file_types:
-                files.append(os.path.join(root, filename))
-    return files
+    for file in get_file_list(directory, allowed_file_types, threads, skip_dirs, stop):
+        files.append(file)
+        yield file
 
+    # Never store a partial listing from a walk that was stopped early
+    if mtime is not None and not (stop and stop.is_set()):
+        save_file_list_cache(key, mtime, started, files)
 
-def fzf_select(files):
-    """Use fzf to interactively select a file."""
-    # Get the file names without the '~/GoogleDrive/' part for user selection
-    file_names = [
-        file.replace(os.path.expanduser("~/GoogleDrive/"), "") for file in files
-    ]
 
-    # Join the file names back with newline characters for fzf input
-    fzf_input = "\n".join(file_names)
+def file_list_cache_path(key):
+    """Get the cache file holding the listing for key."""
+    digest = hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()
+    return os.path.join(CACHE_DIR, f"filelist-{digest}.gz")
 
-    # Prepare the fzf command with the original files list for the preview
-    fzf_cmd = ["fzf"]
 
+def load_file_list_cache(key, mtime):
+    """Load the cached listing for key if it is still fresh, otherwise return None.
+
+    The first line is a JSON header with the key, the directory mtime and the
+    time of the walk, so stale listings are rejected before the paths are read.
+    """
     try:
-        # Run fzf command and capture the selected file name
-        selected_file_name = subprocess.check_output(
-            fzf_cmd, input=fzf_input, text=True
-        ).strip()
-
-        # Retrieve the full path of the selected file using the original list
-        selected_file = next(
-            file for file in files if file.endswith(selected_file_name)
-        )
+        with gzip.open(
+            file_list_cache_path(key),
+            "rt",
+            encoding="utf-8",
+            errors="surrogateescape",
+            newline="\n",
+        ) as file:
+            header = json.loads(file.readline())
+            if not (
+                isinstance(header, dict)
+                and header.get("key") == key
+                and header.get("mtime") == mtime
+                and isinstance(header.get("time"), (int, float))
+                and time.time() - header["time"] < CACHE_TTL
+            ):
+                return None
+            # Split on "\n" only, paths may contain other line separators
+            files = file.read().split("\n")
+            files.pop()  # The writer terminates every path with "\n"
+            return files
+    except (OSError, EOFError, ValueError, zlib.error):
+        # Missing, truncated or corrupt cache files are plain misses
+        return None
 
-        # Display the file using the appropriate viewer based on its extension
-        open_file_with_appropriate_viewer(selected_file)
-    except subprocess.CalledProcessError:
+
+def save_file_list_cache(key, mtime, started, files):
+    """Atomically write the listing for key to its cache file."""
+    cache_file = file_list_cache_path(key)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    header = {"key": key, "mtime": mtime, "time": started}
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with gzip.open(
+            tmp_file, "wt", encoding="utf-8", errors="surrogateescape", newline="\n"
+        ) as file:
+            file.write(json.dumps(header))
+            file.write("\n")
+            for path in files:
+                file.write(path)
+                file.write("\n")
+        os.replace(tmp_file, cache_file)
+    except (OSError, ValueError):
+        # The cache is only an optimisation, never fail the command over it
+        pass
+
+
+def fzf_select(files, stop=None):
+    """Use fzf to interactively select a file."""
+    # Map the file names without the '~/GoogleDrive/' part to their full paths
+    prefix = os.path.expanduser("~/GoogleDrive/")
+    plen = len(prefix)
+    file_names = {}
+
+    def strip_prefix():
+        for file in files:
+            file_name = file[plen:] if file.startswith(prefix) else file
+            file_names[file_name] = file
+            yield file_name
+
+    selected_file_name = run_fzf(strip_prefix(), stop)
+    if selected_file_name is None:
         return None
 
+    # Retrieve the full path of the selected file
+    return file_names.get(selected_file_name)
+
+
+def run_fzf(lines, stop=None):
+    """Stream lines to fzf and return the selected one, or None if cancelled.
+
+    The lines are written from a daemon thread so a slow producer cannot delay
+    the return once fzf exits; the optional stop event is then set to end it.
+    """
+    fzf_process = subprocess.Popen(
+        [find_executable("fzf")],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,  # Redirect stdout only
+        text=True,
+        bufsize=1,  # Line buffered so fzf shows results while they are produced
+    )
+
+    def feed():
+        try:
+            # Stream the lines to fzf as they are produced
+            for line in lines:
+                fzf_process.stdin.write(line)
+                fzf_process.stdin.write("\n")
+            fzf_process.stdin.close()
+        except BrokenPipeError:
+            # fzf exited (selection made or cancelled) before all lines were sent
+            pass
+        finally:
+            close_source()
+
+    def close_source():
+        try:
+            lines.close()
+        except (AttributeError, ValueError):
+            # Not a generator, or it is still running in the other thread
+            pass
+
+    threading.Thread(target=feed, daemon=True).start()
+
+    # fzf only writes the selection on exit, so this returns as soon as it exits
+    selected_line = fzf_process.stdout.read()
+    fzf_process.wait()
+    if stop is not None:
+        stop.set()
+    close_source()
+
+    if fzf_process.returncode != 0:
+        return None
+    return selected_line.rstrip("\n")
+
 
 @notes.command()
 @click.argument("note_name", type=click.Path(exists=False))
@@ -117,7 +416,7 @@ def create(note_name, directory):
 
     # Check if the note already exists
     note_path = os.path.join(directory, f"{note_name}.md")
-    if os.path.exists(note_path):
+    if exists_fast(note_path):
         click.secho(f"Error: Note '{note_name}' already exists.", fg="red")
         return
     else:
@@ -150,21 +449,6 @@ def create(note_name, directory):
 )
 def create_project(project_name, template, git, directory):
     """Create a new project folder based on a template."""
-    # Project templates (you can add more as needed)
-
-    project_templates = {
-        "default": {
-            "notes": ["notes.md"],
-            "notes/reference": [],
-        },
-        "webapp": {
-            "src": ["src", "app.py", "static", "templates"],
-            "data": ["data"],
-            "docs": ["docs"],
-            "README.md": "",
-        },
-    }
-
     # Expand the user directory in the provided project folder path
     directory = os.path.expanduser(directory)
 
@@ -172,31 +456,28 @@ def create_project(project_name, template, git, directory):
     project_path = os.path.join(directory, project_name)
 
     # Check if the project folder already exists
-    if os.path.exists(project_path):
-        console.print(f"[red]Error:[/red] Project '{project_name}' already exists.")
+    if exists_fast(project_path):
+        print_error(f"Project '{project_name}' already exists.")
         return
 
     # Check if the specified template exists
-    if template not in project_templates:
-        console.print(f"[red]Error:[/red] Template '{template}' not found.")
+    if template not in COMPILED_TEMPLATES:
+        print_error(f"Template '{template}' not found.")
         return
 
-    # Create the project folder
+    # Create the project folder, the only one whose parents may be missing
     os.makedirs(project_path)
 
-    # Copy files and folders from the template to the project folder
-    template_files = project_templates[template]
-    for folder, items in template_files.items():
-        folder_path = os.path.join(project_path, folder)
-        os.makedirs(folder_path)
-        for item in items:
-            if isinstance(item, str):  # File
-                with open(os.path.join(folder_path, item), "w") as file:
-                    pass
-            else:  # Directory
-                os.makedirs(os.path.join(folder_path, item))
-
-    console.print(
+    # Create the template folders and empty files, parents come before children
+    # so each entry is a single mkdir or open inside the fresh project folder
+    for kind, relative_path in COMPILED_TEMPLATES[template]:
+        path = os.path.join(project_path, relative_path)
+        if kind == "d":
+            os.mkdir(path)
+        else:
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY | os.O_EXCL, 0o644))
+
+    get_console().print(
         f"[green]Success:[/green] Project '{project_name}' created with template '{template}'."
     )
 
@@ -208,10 +489,10 @@ def create_project(project_name, template, git, directory):
 def git_init(project_path):
     """Initialize a Git repository in the project folder."""
     try:
-        subprocess.run(["git", "init"], cwd=project_path, check=True)
-        console.print("[green]Success:[/green] Git repository initialized.")
+        subprocess.run([find_executable("git"), "init"], cwd=project_path, check=True)
+        get_console().print("[green]Success:[/green] Git repository initialized.")
     except subprocess.CalledProcessError:
-        console.print("[red]Error:[/red] Failed to initialize Git repository.")
+        print_error("Failed to initialize Git repository.")
 
 
 @notes.command()
@@ -220,44 +501,49 @@ def git_init(project_path):
     default="~/GoogleDrive/Projects",
     help="Directory to store all notes and files",
 )
-def search_project(directory):
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="Folder name to skip while searching (can be repeated)",
+)
+def search_project(directory, exclude):
     """Search and open files within the project directory and its subfolders."""
     # Expand the tilde '~' symbol to the user's home directory
     directory = os.path.expanduser(directory)
 
     first_level_folders = get_first_level_folders(directory)
     if not first_level_folders:
-        console.print(
-            "[red]Error:[/red] No first-level folders found in the project directory."
-        )
+        print_error("No first-level folders found in the project directory.")
         return
 
     selected_folder_name = fzf_select_project(first_level_folders)
     if not selected_folder_name:
-        # console.print("[red]Error:[/red] No folder selected.")
+        # print_error("No folder selected.")
         return
 
     selected_folder = os.path.join(directory, selected_folder_name)
-    folders, files = get_folders_and_files(selected_folder)
+    folders, files = get_folders_and_files(selected_folder, SKIP_DIRS.union(exclude))
+    # Remember which entries are folders to dispatch the selection without a stat
+    folder_paths = set(folders)
 
     if not folders and not files:
-        console.print(
+        get_console().print(
             f"No files or subfolders found in the selected folder '{selected_folder}'."
         )
         return
 
     if folders:
-        console.print("Subfolders in the selected folder:")
+        get_console().print("Subfolders in the selected folder:")
 
     if files:
-        console.print("Files in the selected folder:")
+        get_console().print("Files in the selected folder:")
 
-    selected_item = fzf_select(folders + files)
+    selected_item = fzf_select(itertools.chain(folders, files))
     if not selected_item:
-        console.print("[red]Error:[/red] No item selected.")
+        print_error("No item selected.")
         return
 
-    if os.path.isdir(selected_item):
+    if selected_item in folder_paths:
         # If the selected item is a folder, show its contents
         files_in_folder = get_files_in_folder(selected_item)
         if files_in_folder:
@@ -265,41 +551,43 @@ def search_project(directory):
             if selected_file:
                 open_file_with_appropriate_viewer(selected_file)
             else:
-                console.print("[red]Error:[/red] No file selected in the folder.")
+                print_error("No file selected in the folder.")
         else:
-            console.print("[red]Error:[/red] No files found in the selected folder.")
+            print_error("No files found in the selected folder.")
     else:
         # If the selected item is a file, directly open it
         open_file_with_appropriate_viewer(selected_item)
 
 
 def get_first_level_folders(directory):
-    """Get a list of first-level folders in the specified directory without '~/GoogleDrive/Projects' in the names."""
-    folders = []
+    """Get the names of the non-hidden first-level folders in the directory."""
     with os.scandir(directory) as entries:
-        for entry in entries:
-            if (
-                entry.is_dir()
-                and not entry.name.startswith(".")
-                and entry.path != os.path.expanduser("~/GoogleDrive/Projects")
-            ):
-                folders.append(
-                    entry.name
-                )  # Append only the folder name without the path
-    return folders
+        return [
+            entry.name
+            for entry in entries
+            if entry.name[0] != "." and entry.is_dir(follow_symlinks=False)
+        ]
 
 
-def get_folders_and_files(directory):
+def get_folders_and_files(directory, skip_dirs=SKIP_DIRS):
     """Get a list of folders and files in the specified directory and its subdirectories."""
     folders = []
     files = []
-    for root, _, entries in os.walk(directory):
-        for entry in entries:
-            full_path = os.path.join(root, entry)
-            if os.path.isdir(full_path) and not full_path.startswith("."):
-                folders.append(full_path)
-            elif os.path.isfile(full_path):
-                files.append(full_path)
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip hidden and skipped folders without descending
+                        if entry.name[0] != "." and entry.name not in skip_dirs:
+                            folders.append(entry.path)
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.path)
+        except OSError:
+            # Skip unreadable directories like os.walk does
+            continue
     return folders, files
 
 
@@ -314,34 +602,140 @@ def get_files_in_folder(folder):
 
 
 def fzf_select_project(items):
-    """Use FZF to interactively select an item from the list and return the full path of the selected folder."""
-    fzf_cmd = ["fzf"]
-    try:
-        # Run FZF command and capture the selected item
-        fzf_process = subprocess.Popen(
-            fzf_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,  # Redirect stdout only
-            text=True,
-        )
-        selected_item, _ = fzf_process.communicate(input="\n".join(items))
-        selected_item = selected_item.strip()
-        return selected_item
-    except subprocess.CalledProcessError:
-        return None
+    """Use FZF to interactively select an item from any iterable of names."""
+    return run_fzf(items)
 
 
 def open_file_with_appropriate_viewer(file_path):
     """Open the file using the appropriate viewer based on its extension."""
-    file_extension = os.path.splitext(file_path)[1]
-    if file_extension == ".md":
-        # Open Markdown (.md) files using nvim or your preferred text editor
-        subprocess.run(["nvim", file_path])
-    elif file_extension == ".pdf":
-        # Open PDF files using zathura or your preferred PDF reader detached from the terminal
-        subprocess.Popen(["zathura", file_path], start_new_session=True)
+    dot = file_path.rfind(".")
+    file_extension = file_path[dot:].lower() if dot > 0 else ""
+    viewer = VIEWERS.get(file_extension)
+    if viewer is None:
+        print_error("Unsupported file type.")
+        return
+
+    viewer_cmd, detach = viewer
+    if detach:
+        spawn_viewer_and_exit([*viewer_cmd, file_path])
+    else:
+        exec_viewer([*viewer_cmd, file_path])
+
+
+def exec_viewer(viewer_cmd):
+    """Replace this process with the viewer, there is nothing left to do after it."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(find_executable(viewer_cmd[0]), viewer_cmd)
+
+
+def spawn_viewer_and_exit(viewer_cmd):
+    """Start the viewer detached from the terminal and exit without interpreter cleanup."""
+    subprocess.Popen(
+        [find_executable(viewer_cmd[0]), *viewer_cmd[1:]], start_new_session=True
+    )
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
+# statx(2) syscall numbers per (CPU family, pointer bits) of the running Python,
+# flags and the offsets of stx_mask and stx_mode in struct statx
+STATX_SYSCALLS = {
+    ("x86", 64): 332,
+    ("x86", 32): 383,
+    ("arm", 64): 291,
+    ("arm", 32): 397,
+}
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x1
+STATX_MASK_OFFSET = 0
+STATX_MODE_OFFSET = 28
+STATX_SIZE = 256
+
+# Resolved on first use: (libc handle, syscall number), or False if unavailable
+_statx_syscall = None
+
+
+def find_statx_syscall():
+    """Get the libc handle and statx syscall number for this interpreter, or False."""
+    if not sys.platform.startswith("linux"):
+        return False
+    # The kernel may be 64-bit under a 32-bit userspace, so use the pointer size
+    # of this interpreter rather than uname() alone
+    machine = os.uname().machine
+    if machine in ("x86_64", "amd64", "i386", "i486", "i586", "i686"):
+        family = "x86"
+    elif machine in ("aarch64", "arm64") or machine.startswith("arm"):
+        family = "arm"
     else:
-        console.print("[red]Error:[/red] Unsupported file type.")
+        return False
+    if (sysconfig.get_config_var("MULTIARCH") or "").endswith("x32"):
+        return False  # The x32 ABI uses its own syscall numbers
+    number = STATX_SYSCALLS.get((family, struct.calcsize("P") * 8))
+    if number is None:
+        return False
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return False
+    libc.syscall.restype = ctypes.c_long
+    return libc, number
+
+
+def statx_mode(path):
+    """Return the file type bits of path via statx, served from the kernel cache.
+
+    Symlinks are not followed. Returns None if the path does not exist, raises
+    OSError(ENOSYS) if statx cannot be used on this system and OSError(ENODATA)
+    if the filesystem did not report the file type.
+    """
+    global _statx_syscall
+    if _statx_syscall is None:
+        _statx_syscall = find_statx_syscall()
+    if not _statx_syscall:
+        raise OSError(errno.ENOSYS, "statx is not available")
+    libc, number = _statx_syscall
+
+    buf = ctypes.create_string_buffer(STATX_SIZE)
+    result = libc.syscall(
+        ctypes.c_long(number),
+        ctypes.c_int(AT_FDCWD),
+        ctypes.c_char_p(os.fsencode(path)),
+        ctypes.c_int(AT_STATX_DONT_SYNC | AT_SYMLINK_NOFOLLOW),
+        ctypes.c_uint(STATX_TYPE),
+        buf,
+    )
+    if result != 0:
+        err = ctypes.get_errno()
+        if err in (errno.ENOENT, errno.ENOTDIR):
+            return None
+        if err == errno.ENOSYS:
+            _statx_syscall = False
+        raise OSError(err, os.strerror(err), path)
+    mask = int.from_bytes(
+        buf.raw[STATX_MASK_OFFSET : STATX_MASK_OFFSET + 4], sys.byteorder
+    )
+    if not mask & STATX_TYPE:
+        raise OSError(errno.ENODATA, "statx did not return the file type", path)
+    mode = int.from_bytes(
+        buf.raw[STATX_MODE_OFFSET : STATX_MODE_OFFSET + 2], sys.byteorder
+    )
+    return stat.S_IFMT(mode)
+
+
+def exists_fast(path):
+    """Check if the path exists without forcing a sync on network mounts.
+
+    Like os.path.lexists, a dangling symlink counts as existing, so a note or
+    project is never created through a symlink that points elsewhere.
+    """
+    try:
+        return statx_mode(path) is not None
+    except OSError:
+        return os.path.lexists(path)
 
 
 if __name__ == "__main__":
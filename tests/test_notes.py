@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("click")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Notes  # noqa: E402
+
+
+@pytest.fixture
+def notes_tree(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(Notes, "CACHE_DIR", str(cache_dir))
+    root = tmp_path / "notes"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.md").write_text("# a")
+    (root / "sub" / "b.pdf").write_bytes(b"")
+    return root, cache_dir
+
+
+def test_complete_walk_with_stop_event_writes_cache(notes_tree):
+    root, cache_dir = notes_tree
+    stop = threading.Event()
+
+    files = list(
+        Notes.get_cached_file_list(str(root), Notes.ALLOWED_FILE_TYPES, stop=stop)
+    )
+
+    assert sorted(files) == [str(root / "a.md"), str(root / "sub" / "b.pdf")]
+    assert not stop.is_set()
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_stopped_walk_is_not_cached(notes_tree):
+    root, cache_dir = notes_tree
+    stop = threading.Event()
+    stop.set()
+
+    list(Notes.get_cached_file_list(str(root), Notes.ALLOWED_FILE_TYPES, stop=stop))
+
+    assert not cache_dir.exists()
+
+
+def test_cache_round_trips_paths_with_line_separators(notes_tree):
+    root, _ = notes_tree
+    (root / "a\u2028b\rc.md").write_text("")
+    expected = sorted(
+        Notes.get_cached_file_list(str(root), Notes.ALLOWED_FILE_TYPES)
+    )
+
+    cached = sorted(Notes.get_cached_file_list(str(root), Notes.ALLOWED_FILE_TYPES))
+
+    assert str(root / "a\u2028b\rc.md") in expected
+    assert cached == expected